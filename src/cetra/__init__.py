@@ -7,19 +7,28 @@ YAML flow orchestration for AI agents.
 __version__ = "0.1.0"
 
 from .parser import FlowParser, FlowParserError, FlowFileError, FlowValidationError
+from .parser import WorkflowParser, WorkflowParserError, WorkflowFileError, WorkflowValidationError
 from .models import FlowConfig, FlowStep, ToolCall, FlowAction, ToolParameter, ToolOutput
+from .models import WorkflowConfig, WorkflowStep, AgentConfig
 
 __all__ = [
     "FlowParser",
-    "FlowParserError", 
+    "FlowParserError",
     "FlowFileError",
     "FlowValidationError",
+    "WorkflowParser",
+    "WorkflowParserError",
+    "WorkflowFileError",
+    "WorkflowValidationError",
     "FlowConfig",
     "FlowStep",
     "ToolCall",
     "FlowAction",
     "ToolParameter",
     "ToolOutput",
+    "WorkflowConfig",
+    "WorkflowStep",
+    "AgentConfig",
 ]
 
 def hello() -> str:
@@ -1,11 +1,44 @@
-from cetra.models import AgentConfig
+"""
+Agent factory for CETRA.
+
+Builds controlflow agents from validated workflow agent configurations.
+"""
+
+from functools import lru_cache
+
 import controlflow as cf
 
+from .models import AgentConfig
+
+
+@lru_cache(maxsize=None)
+def _build_agent(instructions: str, temperature: float) -> cf.Agent:
+    """Build a cf.Agent for one agent configuration.
+
+    Memoized so identical (instructions, temperature) configurations
+    share a single agent instance instead of being rebuilt per call.
+    temperature participates in the memo key even though cf.Agent does
+    not take it directly; it keeps differently-tuned configs distinct.
+    """
+    return cf.Agent(instructions=instructions)
+
+
 class AgentFactory:
+    """Factory turning workflow agent configs into controlflow agents."""
 
-    def create_agents(self, workflow_config_agents:dict[str, AgentConfig])->dict[str, cf.Agent]:
-        ret = {}
-        for name, agent_config in workflow_config_agents.items():
-            ret[name] = cf.Agent()
+    def create_agents(self, workflow_config_agents: dict[str, AgentConfig]) -> dict[str, cf.Agent]:
+        """Create one named cf.Agent per agent configuration.
 
+        Args:
+            workflow_config_agents: Mapping of agent name to its config,
+                as found on WorkflowConfig.agents
 
+        Returns:
+            Mapping of agent name to its (possibly shared) cf.Agent
+        """
+        if not workflow_config_agents:
+            return {}
+        return {
+            name: _build_agent(agent_config.instructions, agent_config.temperature)
+            for name, agent_config in workflow_config_agents.items()
+        }
@@ -5,12 +5,21 @@ These models define the structure for YAML flow definitions
 that will be parsed and executed by CETRA agents.
 """
 
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Shared model configuration: instances are treated as read-only after
+# validation, so they are frozen (which also makes them hashable); schemas
+# are built eagerly at import time. Unknown keys stay ignored rather than
+# forbidden because existing flow files carry extra nested metadata (e.g.
+# 'properties' blocks inside tool parameters and outputs).
+_MODEL_CONFIG = ConfigDict(frozen=True, defer_build=False)
 
 
 class ToolParameter(BaseModel):
     """Parameter definition for tool calls."""
+    model_config = _MODEL_CONFIG
+
     type: str = Field(..., description="Parameter type (e.g., 'string')")
     description: str = Field(..., description="Parameter description")
     required: bool = Field(False, description="Whether the parameter is required")
@@ -18,20 +27,48 @@ class ToolParameter(BaseModel):
 
 class ToolOutput(BaseModel):
     """Output definition for tool calls."""
+    model_config = _MODEL_CONFIG
+
     type: str = Field(..., description="Output type (e.g., 'string')")
     description: str = Field(..., description="Output description")
 
 
 class ToolCall(BaseModel):
-    """Tool call configuration for a flow step."""
+    """Tool call configuration for a flow step.
+
+    Parameters are stored as an ordered tuple of (name, parameter)
+    pairs rather than a dict: validation builds one flat tuple and
+    iteration is a plain tuple walk, which is cheaper than a hash table
+    for the ordered traversal tool-call emission does. Use
+    parameters_dict for name-based lookup.
+    """
+    model_config = _MODEL_CONFIG
+
     name: str = Field(..., description="Name of the tool to call")
     description: str = Field(..., description="Description of what the tool does")
-    parameters: Dict[str, ToolParameter] = Field(..., description="Tool parameters")
+    parameters: Tuple[Tuple[str, ToolParameter], ...] = Field(
+        ..., description="Tool parameters as ordered (name, parameter) pairs"
+    )
     output: Optional[Dict[str, ToolOutput]] = Field(None, description="Expected tool outputs")
 
+    @field_validator('parameters', mode='before')
+    @classmethod
+    def _parameters_as_pairs(cls, value):
+        """Accept the YAML mapping form and flatten it into pairs."""
+        if isinstance(value, dict):
+            return tuple(value.items())
+        return value
+
+    @property
+    def parameters_dict(self) -> Dict[str, ToolParameter]:
+        """Parameters as a name -> parameter mapping."""
+        return dict(self.parameters)
+
 
 class FlowAction(BaseModel):
     """Action to take based on conditions."""
+    model_config = _MODEL_CONFIG
+
     condition: str = Field(..., description="Condition to evaluate")
     next_step: Optional[str] = Field(None, description="Next step ID to execute")
 
@@ -42,6 +79,8 @@ class FlowStep(BaseModel):
     Each step can contain a prompt, tool call, response template,
     and conditional actions to determine the next step.
     """
+    model_config = _MODEL_CONFIG
+
     id: str = Field(..., description="Unique ID for this flow step")
     prompt: Optional[str] = Field(None, description="Prompt to display or process")
     tool_call: Optional[ToolCall] = Field(None, description="Tool to call in this step")
@@ -56,6 +95,48 @@ class FlowConfig(BaseModel):
     Represents the entire flow definition that will be parsed
     from YAML and executed by the CETRA engine.
     """
+    model_config = _MODEL_CONFIG
+
     flow: List[FlowStep] = Field(..., description="List of flow steps to execute")
 
 
+class AgentConfig(BaseModel):
+    """Configuration for a workflow agent."""
+    model_config = _MODEL_CONFIG
+
+    instructions: str = Field(..., description="System instructions for the agent")
+    temperature: float = Field(0.7, description="Sampling temperature for the agent")
+
+
+class WorkflowStep(BaseModel):
+    """A single step in a workflow execution.
+
+    Each step names the agent that runs it and the instruction
+    template it is asked to perform.
+    """
+    model_config = _MODEL_CONFIG
+
+    name: str = Field(..., description="Unique name for this workflow step")
+    agent: str = Field(..., description="Name of the agent executing this step")
+    ask: str = Field(..., description="Instruction template for the step")
+
+
+class WorkflowConfig(BaseModel):
+    """Complete configuration for a CETRA workflow.
+
+    Represents the entire workflow definition that will be parsed
+    from YAML and executed by the CETRA engine.
+    """
+    model_config = _MODEL_CONFIG
+
+    name: str = Field(..., description="Workflow name")
+    description: Optional[str] = Field(None, description="Workflow description")
+    agents: Dict[str, AgentConfig] = Field(..., description="Agents available to the workflow")
+    steps: List[WorkflowStep] = Field(..., description="List of workflow steps to execute")
+
+
+# Pre-build the pydantic-core schemas at import time so the first
+# load_flow/load_workflow call pays only validation cost, not schema
+# construction.
+FlowConfig.model_rebuild()
+WorkflowConfig.model_rebuild()
@@ -1,16 +1,41 @@
 """
-YAML flow parser for CETRA.
+YAML flow and workflow parsers for CETRA.
 
-Provides functionality to parse YAML flow files and convert them
-into validated Pydantic models.
+Provides functionality to parse YAML flow and workflow files and
+convert them into validated Pydantic models. Both parsers share a
+single generic implementation, YamlModelParser, specialized only by
+the target model, the top-level YAML key and the error types.
 """
 
+import os
+import threading
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import StringIO
+from itertools import islice
 from pathlib import Path
-from typing import Union
-from pydantic import ValidationError
+from typing import Annotated, Callable, Dict, Generic, Iterable, List, Optional, Type, TypeVar, Union
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from .models import FlowConfig
+from .models import AgentConfig, FlowConfig, FlowStep, WorkflowConfig, WorkflowStep
+
+try:
+    # Prefer libyaml's C scanner when available; it is ~10x faster than
+    # the pure-Python SafeLoader and raises the same yaml.YAMLError hierarchy.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # Optional fast path: msgspec fuses decoding and validation into a
+    # single C pass against the Struct mirrors defined below.
+    import msgspec
+except ImportError:
+    msgspec = None
+
+T = TypeVar('T', bound=BaseModel)
 
 
 class FlowParserError(Exception):
@@ -28,76 +53,514 @@ class FlowValidationError(FlowParserError):
     pass
 
 
-class FlowParser:
+class WorkflowParserError(Exception):
+    """Base exception for workflow parsing errors."""
+    pass
+
+
+class WorkflowFileError(WorkflowParserError):
+    """Raised when there's an issue reading the workflow file."""
+    pass
+
+
+class WorkflowValidationError(WorkflowParserError):
+    """Raised when workflow validation fails."""
+    pass
+
+
+@lru_cache(maxsize=None)
+def _adapter_for(tp) -> TypeAdapter:
+    """Return the TypeAdapter for tp, built once per type.
+
+    TypeAdapter construction compiles the pydantic-core schema; caching
+    here keeps that cost out of parser instantiation, so creating a new
+    FlowParser/WorkflowParser per call stays cheap.
+    """
+    return TypeAdapter(tp)
+
+
+# Parsed-config cache keyed on (kind, resolved path, mtime_ns, size), so
+# re-loading an unchanged file skips both the YAML parse and the Pydantic
+# validation. Bounded LRU: least recently used entries are evicted first.
+# The lock keeps get/refresh and put/evict atomic, since load_many hits
+# the cache from multiple worker threads.
+_PARSE_CACHE_MAX_ENTRIES = 256
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    """Return the cached config for key, or None; refreshes LRU order."""
+    with _parse_cache_lock:
+        config = _parse_cache.get(key)
+        if config is not None:
+            _parse_cache.move_to_end(key)
+        return config
+
+
+def _cache_put(key, config):
+    """Store config under key, evicting the least recently used entry."""
+    with _parse_cache_lock:
+        _parse_cache[key] = config
+        if len(_parse_cache) > _PARSE_CACHE_MAX_ENTRIES:
+            _parse_cache.popitem(last=False)
+
+
+def _prevalidate_flow(flow_data, filepath):
+    """Cheap structural checks on the raw flow data.
+
+    Rejects obviously malformed input with plain dict/list operations
+    before the (comparatively expensive) Pydantic validator runs.
+
+    Raises:
+        FlowValidationError: If the flow structure is implausible
+    """
+    if not isinstance(flow_data, list):
+        raise FlowValidationError(
+            f"'flow' section must be a list of steps, got {type(flow_data).__name__}: {filepath}"
+        )
+    if not flow_data:
+        raise FlowValidationError(f"'flow' section is empty: {filepath}")
+    for index, step in enumerate(flow_data):
+        if not isinstance(step, dict):
+            raise FlowValidationError(
+                f"Flow step {index} must be a mapping, got {type(step).__name__}: {filepath}"
+            )
+        if 'id' not in step:
+            raise FlowValidationError(f"Flow step {index} is missing required field 'id': {filepath}")
+
+
+def _prevalidate_workflow(workflow_data, filepath):
+    """Cheap structural checks on the raw workflow data.
+
+    Rejects obviously malformed input with plain dict/list operations
+    before the (comparatively expensive) Pydantic validator runs.
+
+    Raises:
+        WorkflowValidationError: If the workflow structure is implausible
+    """
+    if not isinstance(workflow_data, dict):
+        raise WorkflowValidationError(
+            f"'workflow' section must be a mapping, got {type(workflow_data).__name__}: {filepath}"
+        )
+    if 'name' not in workflow_data:
+        raise WorkflowValidationError(f"Workflow is missing required field 'name': {filepath}")
+    steps = workflow_data.get('steps')
+    if not isinstance(steps, list) or not steps:
+        raise WorkflowValidationError(f"Workflow must contain a non-empty 'steps' list: {filepath}")
+    for index, step in enumerate(steps):
+        if not isinstance(step, dict):
+            raise WorkflowValidationError(
+                f"Workflow step {index} must be a mapping, got {type(step).__name__}: {filepath}"
+            )
+        for field in ('name', 'agent'):
+            if field not in step:
+                raise WorkflowValidationError(
+                    f"Workflow step {index} is missing required field '{field}': {filepath}"
+                )
+
+
+class YamlModelParser(Generic[T]):
+    """Generic parser for YAML files validated against a Pydantic model.
+
+    Handles file reading, YAML parsing, caching and Pydantic validation
+    with clear error messages. Subclasses (FlowParser, WorkflowParser)
+    only supply the model, the top-level key and the error types.
+    """
+
+    def __init__(
+        self,
+        model: Type[T],
+        top_key: str,
+        top_key_wraps: bool,
+        file_error: Type[Exception],
+        validation_error: Type[Exception],
+        prevalidate: Optional[Callable] = None,
+    ):
+        """Configure the parser for one model type.
+
+        Args:
+            model: Pydantic model the file is validated against
+            top_key: Required top-level key in the YAML document
+            top_key_wraps: If True the model has a single field named
+                top_key wrapping the section (FlowConfig); the section is
+                validated with the field's own pre-compiled validator and
+                the wrapper is built with model_construct. If False the
+                section itself is the model (WorkflowConfig).
+            file_error: Exception type raised for read problems
+            validation_error: Exception type raised for invalid content
+            prevalidate: Optional cheap structural check run on the raw
+                section before the Pydantic validator
+        """
+        self.model = model
+        self.top_key = top_key
+        self.top_key_wraps = top_key_wraps
+        self._file_error = file_error
+        self._validation_error = validation_error
+        self._prevalidate = prevalidate
+        self._kind = top_key
+        self._kind_title = top_key.capitalize()
+        if top_key_wraps:
+            section_type = model.model_fields[top_key].annotation
+        else:
+            section_type = model
+        self._validate_section = _adapter_for(section_type).validator.validate_python
+
+    def load(self, filepath: Union[str, Path]) -> T:
+        """Load, parse and validate a YAML file into the target model.
+
+        Args:
+            filepath: Path to the YAML file
+
+        Returns:
+            Validated model instance
+
+        Raises:
+            The parser's file error if the file cannot be read, or its
+            validation error if the content is invalid
+        """
+        filepath = Path(filepath)
+
+        # A single stat covers the existence check and the cache key;
+        # other read problems surface from read_bytes below
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            raise self._file_error(f"{self._kind_title} file not found: {filepath}")
+        except PermissionError:
+            raise self._file_error(f"Permission denied reading file: {filepath}")
+        except OSError as e:
+            raise self._file_error(f"Error reading {self._kind} file {filepath}: {e}")
+
+        # Return the cached config if the file is unchanged
+        cache_key = (self.top_key, str(filepath.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        section = self._read_section(filepath)
+
+        # Fail fast on structural errors before the full Pydantic pass
+        if self._prevalidate is not None:
+            self._prevalidate(section, filepath)
+
+        try:
+            # Validate with the pre-compiled validator; for wrapping models
+            # the outer single-field validation is skipped via model_construct
+            validated = self._validate_section(section)
+            if self.top_key_wraps:
+                config = self.model.model_construct(**{self.top_key: validated})
+            else:
+                config = validated
+            _cache_put(cache_key, config)
+            return config
+
+        except ValidationError as e:
+            # Write the report into one buffer instead of building
+            # per-error lists and joining them; skip the documentation
+            # URL and context strings pydantic would otherwise format
+            buf = StringIO()
+            buf.write(f"{self._kind_title} validation failed in {filepath}:\n")
+            for error in e.errors(include_url=False, include_context=False):
+                # Error locations are relative to the section; re-anchor
+                # them under the top-level key to match the file structure
+                buf.write('  - ')
+                buf.write(self.top_key)
+                for loc in error['loc']:
+                    buf.write('.')
+                    buf.write(str(loc))
+                buf.write(': ')
+                buf.write(error['msg'])
+                buf.write('\n')
+
+            raise self._validation_error(buf.getvalue().rstrip('\n'))
+        except Exception as e:
+            raise self._validation_error(f"Error validating {self._kind} in {filepath}: {e}")
+
+    def _read_section(self, filepath: Path):
+        """Read a YAML file and return its top-level section, unvalidated.
+
+        Handles the read, the YAML parse and the document-shape checks
+        shared by the validating and non-validating load paths.
+
+        Raises:
+            The parser's file error if the file cannot be read, or its
+            validation error if the document shape is wrong
+        """
+        try:
+            # Read the whole file in one call and hand the bytes straight
+            # to the loader; this skips the TextIOWrapper buffering and
+            # Python-level UTF-8 decoding
+            yaml_data = yaml.load(filepath.read_bytes(), Loader=_YamlLoader)
+
+        except FileNotFoundError:
+            raise self._file_error(f"{self._kind_title} file not found: {filepath}")
+        except IsADirectoryError:
+            raise self._file_error(f"Path is not a file: {filepath}")
+        except PermissionError:
+            raise self._file_error(f"Permission denied reading file: {filepath}")
+        except yaml.YAMLError as e:
+            raise self._validation_error(f"Invalid YAML format in {filepath}: {e}")
+        except Exception as e:
+            raise self._file_error(f"Error reading {self._kind} file {filepath}: {e}")
+
+        # Validate YAML data is not empty
+        if yaml_data is None:
+            raise self._validation_error(f"{self._kind_title} file is empty: {filepath}")
+
+        # Validate structure
+        if not isinstance(yaml_data, dict):
+            raise self._validation_error(
+                f"{self._kind_title} file must contain a YAML object, got {type(yaml_data).__name__}: {filepath}"
+            )
+
+        # Check for the top-level section
+        section = yaml_data.get(self.top_key)
+        if section is None:
+            raise self._validation_error(
+                f"{self._kind_title} file must contain a '{self.top_key}' section: {filepath}"
+            )
+
+        return section
+
+    def load_many(self, filepaths: Iterable[Union[str, Path]]) -> List[T]:
+        """Load and parse several YAML files concurrently.
+
+        libyaml releases the GIL while scanning, so a thread pool gives
+        real parallelism when loading a directory of files instead of
+        paying N sequential read + parse round trips.
+
+        Args:
+            filepaths: Paths to the YAML files
+
+        Returns:
+            List of validated model instances, in input order
+
+        Raises:
+            The parser's file or validation error if any file fails
+        """
+        filepaths = list(filepaths)
+        if len(filepaths) <= 1:
+            return [self.load(filepath) for filepath in filepaths]
+
+        max_workers = min(len(filepaths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.load, filepaths))
+
+
+class FlowParser(YamlModelParser[FlowConfig]):
     """Parser for YAML flow files.
-    
+
     Converts YAML flow definitions into validated FlowConfig objects.
-    Handles file reading, YAML parsing, and Pydantic validation with clear error messages.
     """
-    
+
+    def __init__(self):
+        super().__init__(
+            FlowConfig,
+            'flow',
+            top_key_wraps=True,
+            file_error=FlowFileError,
+            validation_error=FlowValidationError,
+            prevalidate=_prevalidate_flow,
+        )
+
     def load_flow(self, filepath: Union[str, Path]) -> FlowConfig:
         """Load and parse a YAML flow file.
-        
+
         Args:
             filepath: Path to the YAML flow file
-            
+
         Returns:
             FlowConfig: Validated flow configuration object
-            
+
         Raises:
             FlowFileError: If the file cannot be read or doesn't exist
             FlowValidationError: If the YAML structure is invalid or doesn't match the schema
         """
+        return self.load(filepath)
+
+    def load_flow_unvalidated(self, filepath: Union[str, Path]) -> FlowConfig:
+        """Load a YAML flow file without running Pydantic validation.
+
+        Builds the FlowConfig with model_construct, which skips the
+        validator entirely and is an order of magnitude faster than a
+        validated load. Only the cheap structural pre-checks run; nested
+        tool_call/actions data stays as raw dicts rather than model
+        instances. Intended for trusted inputs only, e.g. files that a
+        previous validated load already accepted.
+
+        Args:
+            filepath: Path to the YAML flow file
+
+        Returns:
+            FlowConfig: Unvalidated flow configuration object
+
+        Raises:
+            FlowFileError: If the file cannot be read or doesn't exist
+            FlowValidationError: If the YAML or the top-level structure is invalid
+        """
         filepath = Path(filepath)
-        
-        # Check if file exists
-        if not filepath.exists():
-            raise FlowFileError(f"Flow file not found: {filepath}")
-        
-        if not filepath.is_file():
-            raise FlowFileError(f"Path is not a file: {filepath}")
-        
+        flow_data = self._read_section(filepath)
+        _prevalidate_flow(flow_data, filepath)
+        steps = [FlowStep.model_construct(**step) for step in flow_data]
+        return FlowConfig.model_construct(flow=steps)
+
+    def load_flows(self, filepaths: Iterable[Union[str, Path]]) -> List[FlowConfig]:
+        """Load and parse several YAML flow files concurrently.
+
+        See YamlModelParser.load_many.
+        """
+        return self.load_many(filepaths)
+
+
+if msgspec is not None:
+    # Struct mirrors of the workflow models. msgspec validates these
+    # while decoding, so a well-formed file never touches the pydantic
+    # validator; the structs are converted with model_construct. Kept in
+    # sync with models.py by test_load_workflow_fast_path_matches.
+
+    class _AgentConfigStruct(msgspec.Struct):
+        instructions: str
+        temperature: float = 0.7
+
+    class _WorkflowStepStruct(msgspec.Struct):
+        name: str
+        agent: str
+        ask: str
+
+    class _WorkflowConfigStruct(msgspec.Struct):
+        name: str
+        agents: Dict[str, _AgentConfigStruct]
+        # min_length mirrors _prevalidate_workflow's non-empty check so a
+        # file is accepted or rejected the same way on both paths
+        steps: Annotated[List[_WorkflowStepStruct], msgspec.Meta(min_length=1)]
+        description: Optional[str] = None
+
+    class _WorkflowDocStruct(msgspec.Struct):
+        workflow: _WorkflowConfigStruct
+
+
+class WorkflowParser(YamlModelParser[WorkflowConfig]):
+    """Parser for YAML workflow files.
+
+    Converts YAML workflow definitions into validated WorkflowConfig objects.
+    """
+
+    def __init__(self):
+        super().__init__(
+            WorkflowConfig,
+            'workflow',
+            top_key_wraps=False,
+            file_error=WorkflowFileError,
+            validation_error=WorkflowValidationError,
+            prevalidate=_prevalidate_workflow,
+        )
+
+    def load_workflow(self, filepath: Union[str, Path]) -> WorkflowConfig:
+        """Load and parse a YAML workflow file.
+
+        Args:
+            filepath: Path to the YAML workflow file
+
+        Returns:
+            WorkflowConfig: Validated workflow configuration object
+
+        Raises:
+            WorkflowFileError: If the file cannot be read or doesn't exist
+            WorkflowValidationError: If the YAML structure is invalid or doesn't match the schema
+        """
+        if msgspec is not None:
+            filepath = Path(filepath)
+            try:
+                st = filepath.stat()
+            except OSError:
+                # Let the standard path produce its usual error message
+                return self.load(filepath)
+
+            cache_key = (self.top_key, str(filepath.resolve()), st.st_mtime_ns, st.st_size)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            config = self._load_workflow_fast(filepath)
+            if config is not None:
+                _cache_put(cache_key, config)
+                return config
+
+        return self.load(filepath)
+
+    def _load_workflow_fast(self, filepath: Path) -> Optional[WorkflowConfig]:
+        """Fused msgspec decode + validate fast path.
+
+        Decodes the file directly into the Struct mirrors, validating
+        while parsing, and converts the result into a WorkflowConfig
+        with model_construct (no second validation pass). Returns None
+        on any failure so the caller falls back to the standard path,
+        which produces the usual detailed errors.
+        """
         try:
-            # Read and parse YAML file
-            with open(filepath, 'r', encoding='utf-8') as file:
-                yaml_data = yaml.safe_load(file)
-                
+            doc = msgspec.yaml.decode(filepath.read_bytes(), type=_WorkflowDocStruct)
+        except (msgspec.DecodeError, OSError):
+            return None
+
+        wf = doc.workflow
+        return WorkflowConfig.model_construct(
+            name=wf.name,
+            description=wf.description,
+            agents={
+                name: AgentConfig.model_construct(
+                    instructions=agent.instructions, temperature=agent.temperature
+                )
+                for name, agent in wf.agents.items()
+            },
+            steps=[
+                WorkflowStep.model_construct(name=step.name, agent=step.agent, ask=step.ask)
+                for step in wf.steps
+            ],
+        )
+
+    def peek_name(self, filepath: Union[str, Path], max_lines: int = 20) -> str:
+        """Read only the head of a workflow file to extract its name.
+
+        Useful when scanning many workflow files for one by name: a
+        header-only parse avoids fully loading and validating each
+        candidate. Falls back to a full load_workflow if the name cannot
+        be found in the first max_lines lines.
+
+        Args:
+            filepath: Path to the YAML workflow file
+            max_lines: Number of lines to read for the header parse
+
+        Returns:
+            The workflow name
+
+        Raises:
+            WorkflowFileError: If the file cannot be read or doesn't exist
+            WorkflowValidationError: If the fallback full parse fails validation
+        """
+        filepath = Path(filepath)
+        try:
+            with open(filepath, 'rb') as file:
+                head = b''.join(islice(file, max_lines))
+            data = yaml.load(head, Loader=_YamlLoader)
+            name = data['workflow']['name']
+            if isinstance(name, str):
+                return name
+        except (yaml.YAMLError, KeyError, TypeError):
+            # Header parse failed (e.g. a construct truncated mid-line);
+            # fall through to the full parse below
+            pass
         except FileNotFoundError:
-            raise FlowFileError(f"Flow file not found: {filepath}")
+            raise WorkflowFileError(f"Workflow file not found: {filepath}")
         except PermissionError:
-            raise FlowFileError(f"Permission denied reading file: {filepath}")
-        except yaml.YAMLError as e:
-            raise FlowValidationError(f"Invalid YAML format in {filepath}: {e}")
-        except Exception as e:
-            raise FlowFileError(f"Error reading flow file {filepath}: {e}")
-        
-        # Validate YAML data is not empty
-        if yaml_data is None:
-            raise FlowValidationError(f"Flow file is empty: {filepath}")
-        
-        # Validate structure
-        if not isinstance(yaml_data, dict):
-            raise FlowValidationError(f"Flow file must contain a YAML object, got {type(yaml_data).__name__}: {filepath}")
-        
-        # Check for flow section
-        flow_data = yaml_data.get('flow')
-        if flow_data is None:
-            raise FlowValidationError(f"Flow file must contain a 'flow' section: {filepath}")
-        
-        try:
-            # Create and validate FlowConfig
-            return FlowConfig(flow=flow_data)
-            
-        except ValidationError as e:
-            error_details = []
-            for error in e.errors():
-                field = '.'.join(str(loc) for loc in error['loc'])
-                msg = error['msg']
-                error_details.append(f"{field}: {msg}")
-            
-            raise FlowValidationError(
-                f"Flow validation failed in {filepath}:\n" + 
-                '\n'.join(f"  - {detail}" for detail in error_details)
-            )
-        except Exception as e:
-            raise FlowValidationError(f"Error validating flow in {filepath}: {e}")
\ No newline at end of file
+            raise WorkflowFileError(f"Permission denied reading file: {filepath}")
+        except OSError as e:
+            raise WorkflowFileError(f"Error reading workflow file {filepath}: {e}")
+
+        return self.load_workflow(filepath).name
+
+
+# Shared stateless instances; prefer these over constructing a new parser
+# per call so the module-level validator caches are reused.
+_FLOW_PARSER = FlowParser()
+_WORKFLOW_PARSER = WorkflowParser()